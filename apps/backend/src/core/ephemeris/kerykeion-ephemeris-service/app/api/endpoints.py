@@ -1,56 +1,200 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from ..services.kerykeion_service import KerykeionService
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from typing import Any, Dict, List, Optional, Set
+import hashlib
+import hmac
+import os
+import secrets
+import orjson
+from ..dependencies import kerykeion_service
 from ..models.astronomical import (
+    CHART_VERSION,
     BirthChart,
+    BodyPosition,
+    CelestialBody,
     DateTime,
     GeoPosition,
     HouseSystem,
-    CelestialBody,
     Aspect,
     House,
-    AstrologicalEvent,
-    FixedStar,
-    LunarPhase,
     DateRange
 )
 
 router = APIRouter()
-kerykeion_service = KerykeionService()
 
-@router.post("/birth-chart", response_model=BirthChart)
-async def calculate_birth_chart(
+# Derived House fields a client can ask for with ?include=
+_HOUSE_INCLUDE_FIELDS = {"next_cusp", "size"}
+
+def _house_fields(include: Optional[str]) -> Set[str]:
+    """Parse the comma-separated include query parameter."""
+    fields = {field.strip() for field in include.split(",") if field.strip()} if include else set()
+    unknown = fields - _HOUSE_INCLUDE_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include fields: {', '.join(sorted(unknown))}")
+    return fields
+
+_INCLUDE_QUERY = Query(None, description="Comma-separated derived house fields to add: next_cusp,size")
+
+# A chart is fully determined by its inputs and CHART_VERSION, so clients and
+# HTTP caches may keep a GET /birth-chart response forever.
+_CHART_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def _chart_etag(datetime: DateTime, location: GeoPosition, house_system: HouseSystem, fields: Set[str]) -> str:
+    """Strong ETag over the validated birth-chart inputs."""
+    key = "|".join((
+        CHART_VERSION,
+        datetime.model_dump_json(),
+        location.model_dump_json(exclude_unset=True),
+        house_system.value,
+        ",".join(sorted(fields))
+    ))
+    return f'"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+# Key for signing the charts /birth-chart returns. Set EPHEMERIS_CHART_SIGNING_KEY
+# so every worker shares it; otherwise each process uses its own random key and
+# charts signed by another worker just take the validated path in /transits-signed.
+_CHART_SIGNING_KEY = os.environ.get("EPHEMERIS_CHART_SIGNING_KEY", "").encode() or secrets.token_bytes(32)
+
+def _sign_chart(body: bytes) -> str:
+    """HMAC-SHA256 signature of a serialized chart."""
+    return hmac.new(_CHART_SIGNING_KEY, body, hashlib.sha256).hexdigest()
+
+def _natal_chart(natal: Dict[str, Any], signature: Optional[str]) -> BirthChart:
+    """Rebuild a posted natal chart, skipping validation when we signed it ourselves.
+
+    Transits only read the chart's bodies, so a trusted chart is rebuilt with
+    just its datetime, location and bodies. Anything else is fully validated.
+    """
+    if signature and hmac.compare_digest(_sign_chart(orjson.dumps(natal)), signature):
+        return BirthChart.model_construct(
+            datetime=DateTime.model_construct(**natal["datetime"]),
+            location=GeoPosition.model_construct(**natal["location"]),
+            bodies=[
+                BodyPosition.model_construct(**{**body, "id": CelestialBody(body["id"])})
+                for body in natal["bodies"]
+            ]
+        )
+    return BirthChart.model_validate(natal)
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header covers etag (weak comparison, as RFC 9110 asks)."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+def _datetime_query(
+    year: int = Query(..., description="Year"),
+    month: int = Query(..., description="Month (1-12)"),
+    day: int = Query(..., description="Day of month (1-31)"),
+    hour: int = Query(..., description="Hour (0-23)"),
+    minute: int = Query(..., description="Minute (0-59)"),
+    second: int = Query(..., description="Second (0-59)"),
+    timezone: str = Query("UTC", description="Timezone name")
+) -> DateTime:
+    """Birth DateTime from query parameters."""
+    try:
+        return DateTime(year=year, month=month, day=day, hour=hour, minute=minute, second=second, timezone=timezone)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+def _location_query(
+    latitude: float = Query(..., description="Latitude in degrees"),
+    longitude: float = Query(..., description="Longitude in degrees"),
+    altitude: Optional[float] = Query(None, description="Altitude in meters")
+) -> GeoPosition:
+    """Birth GeoPosition from query parameters; altitude is only set when given."""
+    values = {"latitude": latitude, "longitude": longitude}
+    if altitude is not None:
+        values["altitude"] = altitude
+    try:
+        return GeoPosition(**values)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+async def _birth_chart_response(
     datetime: DateTime,
     location: GeoPosition,
-    house_system: HouseSystem = HouseSystem.PLACIDUS
-) -> BirthChart:
-    """Calculate a complete birth chart."""
+    house_system: HouseSystem,
+    fields: Set[str],
+    headers: Dict[str, str]
+) -> Response:
+    """Calculate a birth chart and return it signed, with extra headers."""
     try:
-        return await kerykeion_service.calculate_birth_chart(datetime, location, house_system)
+        chart = await kerykeion_service.calculate_birth_chart(datetime, location, house_system)
+        if fields:
+            chart = chart.model_copy(update={"houses": kerykeion_service.expand_houses(chart.houses, fields)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # Serialized here rather than by response_model so the exact bytes can be
+    # signed; clients post them back to /transits-signed
+    body = orjson.dumps(chart.model_dump(mode="json", exclude_unset=True))
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**headers, "X-Chart-Signature": _sign_chart(body)}
+    )
+
+@router.get("/birth-chart", response_model=BirthChart, response_model_exclude_unset=True)
+async def get_birth_chart(
+    request: Request,
+    datetime: DateTime = Depends(_datetime_query),
+    location: GeoPosition = Depends(_location_query),
+    house_system: HouseSystem = HouseSystem.PLACIDUS,
+    include: Optional[str] = _INCLUDE_QUERY
+) -> Response:
+    """Calculate a complete birth chart from query parameters.
+
+    The URL identifies the chart, so the response carries an ETag and is
+    cacheable forever; a matching If-None-Match gets 304.
+    """
+    fields = _house_fields(include)
+    etag = _chart_etag(datetime, location, house_system, fields)
+    cache_headers = {"ETag": etag, "Cache-Control": _CHART_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+    return await _birth_chart_response(datetime, location, house_system, fields, cache_headers)
 
-@router.post("/houses", response_model=List[House])
+@router.post("/birth-chart", response_model=BirthChart, response_model_exclude_unset=True)
+async def calculate_birth_chart(
+    datetime: DateTime,
+    location: GeoPosition,
+    house_system: HouseSystem = HouseSystem.PLACIDUS,
+    include: Optional[str] = _INCLUDE_QUERY
+) -> Response:
+    """Calculate a complete birth chart.
+
+    POST responses are not reused by HTTP caches, so cacheable clients should
+    use GET /birth-chart instead.
+    """
+    return await _birth_chart_response(datetime, location, house_system, _house_fields(include), {})
+
+@router.post("/houses", response_model=List[House], response_model_exclude_unset=True)
 async def calculate_houses(
     datetime: DateTime,
     location: GeoPosition,
-    house_system: HouseSystem = HouseSystem.PLACIDUS
+    house_system: HouseSystem = HouseSystem.PLACIDUS,
+    include: Optional[str] = _INCLUDE_QUERY
 ) -> List[House]:
     """Calculate house cusps."""
+    fields = _house_fields(include)
     try:
-        birth_chart = await kerykeion_service.calculate_birth_chart(datetime, location, house_system)
-        return birth_chart.houses
+        houses = await kerykeion_service.calculate_houses(datetime, location, house_system)
+        return kerykeion_service.expand_houses(houses, fields)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/aspects", response_model=List[Aspect])
 async def calculate_aspects(
-    bodies: List[CelestialBody]
+    datetime: DateTime,
+    location: GeoPosition
 ) -> List[Aspect]:
     """Calculate aspects between celestial bodies."""
     try:
-        # TODO: Implement aspect calculation
-        raise NotImplementedError("Aspect calculation not yet implemented")
+        return await kerykeion_service.calculate_aspects(datetime, location)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -61,40 +205,60 @@ async def calculate_transits(
 ) -> List[Aspect]:
     """Calculate transits for a given date range."""
     try:
-        # TODO: Implement transit calculation
-        raise NotImplementedError("Transit calculation not yet implemented")
+        return await kerykeion_service.calculate_transits(natal_chart, date_range)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/significant-events", response_model=List[AstrologicalEvent])
-async def calculate_significant_events(
-    date_range: DateRange
-) -> List[AstrologicalEvent]:
-    """Calculate significant astrological events for a date range."""
-    try:
-        # TODO: Implement significant events calculation
-        raise NotImplementedError("Significant events calculation not yet implemented")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+@router.post("/transits-signed", response_model=List[Aspect])
+async def calculate_transits_signed(request: Request) -> List[Aspect]:
+    """Calculate transits for a natal chart previously returned by /birth-chart.
 
-@router.post("/fixed-stars", response_model=List[FixedStar])
-async def calculate_fixed_stars(
-    datetime: DateTime
-) -> List[FixedStar]:
-    """Calculate fixed star positions."""
+    The JSON body holds natal_chart (the /birth-chart response as received),
+    signature (its X-Chart-Signature header) and date_range. A chart whose
+    signature checks out is used without re-validation.
+    """
+    try:
+        payload = orjson.loads(await request.body())
+        date_range = DateRange.model_validate(payload["date_range"])
+        natal_chart = _natal_chart(payload["natal_chart"], payload.get("signature"))
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValidationError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
     try:
-        # TODO: Implement fixed star calculation
-        raise NotImplementedError("Fixed star calculation not yet implemented")
+        return await kerykeion_service.calculate_transits(natal_chart, date_range)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/lunar-phases", response_model=List[LunarPhase])
-async def calculate_lunar_phases(
+@router.post("/transits-by-natal-inputs", response_model=List[Aspect])
+async def calculate_transits_by_natal_inputs(
+    datetime: DateTime,
+    location: GeoPosition,
     date_range: DateRange
-) -> List[LunarPhase]:
-    """Calculate lunar phases for a date range."""
+) -> List[Aspect]:
+    """Calculate transits from birth data, without posting a full natal chart."""
     try:
-        # TODO: Implement lunar phase calculation
-        raise NotImplementedError("Lunar phase calculation not yet implemented")
+        natal_chart = await kerykeion_service.calculate_birth_chart(datetime, location)
+        return await kerykeion_service.calculate_transits(natal_chart, date_range)
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Planned endpoints. They are registered without request models or schema so
+# a call is answered with 501 straight away instead of being parsed first.
+_NOT_IMPLEMENTED = {
+    "/significant-events": "Significant events calculation not yet implemented",
+    "/fixed-stars": "Fixed star calculation not yet implemented",
+    "/lunar-phases": "Lunar phase calculation not yet implemented",
+}
+
+def _not_implemented(detail: str):
+    async def handler() -> ORJSONResponse:
+        return ORJSONResponse({"detail": detail}, status_code=501)
+    return handler
+
+for _path, _detail in _NOT_IMPLEMENTED.items():
+    router.add_api_route(_path, _not_implemented(_detail), methods=["POST"], include_in_schema=False)
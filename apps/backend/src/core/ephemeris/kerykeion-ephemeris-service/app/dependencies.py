@@ -0,0 +1,6 @@
+import os
+from .services.kerykeion_service import KerykeionService
+
+# Shared by every router so all routes use one chart cache.
+# EPHEMERIS_CHART_STORE_PATH enables the on-disk chart store shared across workers.
+kerykeion_service = KerykeionService(chart_store_path=os.environ.get("EPHEMERIS_CHART_STORE_PATH"))
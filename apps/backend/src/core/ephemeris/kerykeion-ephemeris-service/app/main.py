@@ -1,11 +1,39 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import multiprocessing
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from .api.endpoints import router as ephemeris_router
+from .dependencies import kerykeion_service
+
+# Worker processes for long transit sweeps, per server process. Keep it small:
+# every uvicorn worker starts its own pool.
+_TRANSIT_POOL_WORKERS = int(os.environ.get("EPHEMERIS_TRANSIT_WORKERS", "2"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the ephemeris and start the transit pool before serving requests."""
+    kerykeion_service.warmup()
+    # Spawned rather than forked: the server already runs threads and holds
+    # SQLite connections that a forked child would inherit mid-use
+    with ProcessPoolExecutor(
+        max_workers=_TRANSIT_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    ) as transit_pool:
+        kerykeion_service.transit_pool = transit_pool
+        try:
+            yield
+        finally:
+            kerykeion_service.transit_pool = None
 
 app = FastAPI(
     title="Ephemeris Service",
     description="Service for calculating astrological positions and aspects",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
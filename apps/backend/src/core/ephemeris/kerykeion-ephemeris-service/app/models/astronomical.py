@@ -1,7 +1,26 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 from typing import List, Optional
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Lookup tables for DateTime.validate_day over the supported 1900-2100 range.
+# February is listed with 29 days and narrowed to 28 outside leap years.
+_LEAP_YEARS = frozenset(y for y in range(1900, 2101) if y % 4 == 0 and (y % 100 != 0 or y % 400 == 0))
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Longest DateRange accepted; transit sweep time grows with the span.
+_MAX_DATE_RANGE_DAYS = 3653
+
+# Version of the chart calculations. Chart ETags and stored charts include it;
+# bump it whenever chart results change so neither outlives the change.
+CHART_VERSION = "2"
+
+@lru_cache(maxsize=512)
+def _tz(name: str) -> ZoneInfo:
+    """Resolve a timezone name once; ZoneInfo lookups are cached per name."""
+    return ZoneInfo(name)
 
 class HouseSystem(str, Enum):
     """Available house systems for astrological calculations."""
@@ -34,12 +53,16 @@ class CelestialBody(str, Enum):
 
 class GeoPosition(BaseModel):
     """Geographical position with latitude and longitude."""
+    model_config = ConfigDict(frozen=True)
+
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
     altitude: Optional[float] = Field(None, ge=0, description="Altitude in meters")
 
 class DateTime(BaseModel):
     """Date and time information with timezone."""
+    model_config = ConfigDict(frozen=True)
+
     year: int = Field(..., ge=1900, le=2100, description="Year")
     month: int = Field(..., ge=1, le=12, description="Month (1-12)")
     day: int = Field(..., ge=1, le=31, description="Day of month (1-31)")
@@ -48,25 +71,42 @@ class DateTime(BaseModel):
     second: int = Field(..., ge=0, le=59, description="Second (0-59)")
     timezone: str = Field(default="UTC", description="Timezone name")
 
-    @validator('day')
-    def validate_day(cls, v, values):
+    @field_validator('day')
+    @classmethod
+    def validate_day(cls, v: int, info: ValidationInfo) -> int:
         """Validate day based on month."""
+        values = info.data
         if 'month' not in values:
             return v
         month = values['month']
-        if month in [4, 6, 9, 11] and v > 30:
-            raise ValueError(f"Month {month} has only 30 days")
-        if month == 2:
-            year = values.get('year', 2000)
-            is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
-            if is_leap and v > 29:
-                raise ValueError("February has only 29 days in leap years")
-            if not is_leap and v > 28:
-                raise ValueError("February has only 28 days in non-leap years")
+        year = values.get('year', 2000)
+        max_day = 28 if month == 2 and year not in _LEAP_YEARS else _DAYS_IN_MONTH[month]
+        if v > max_day:
+            if month == 2:
+                kind = "leap" if max_day == 29 else "non-leap"
+                raise ValueError(f"February has only {max_day} days in {kind} years")
+            raise ValueError(f"Month {month} has only {max_day} days")
+        return v
+
+    @field_validator('timezone')
+    @classmethod
+    def validate_timezone(cls, v: str) -> str:
+        """Validate that the timezone name is known."""
+        try:
+            _tz(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {v}")
         return v
 
+def datetime_to_gmt(dt: DateTime) -> datetime:
+    """Aware GMT datetime for a DateTime's local date and time."""
+    local_dt = datetime(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+    return local_dt.replace(tzinfo=_tz(dt.timezone)).astimezone(UTC)
+
 class BodyPosition(BaseModel):
     """Position of a celestial body."""
+    model_config = ConfigDict(frozen=True)
+
     id: CelestialBody = Field(..., description="Celestial body identifier")
     longitude: float = Field(..., ge=0, lt=360, description="Longitude in degrees")
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
@@ -76,16 +116,21 @@ class BodyPosition(BaseModel):
 
 class House(BaseModel):
     """Astrological house information."""
+    model_config = ConfigDict(frozen=True)
+
     number: int = Field(..., ge=1, le=12, description="House number (1-12)")
     cusp: float = Field(..., ge=0, lt=360, description="House cusp in degrees")
-    next_cusp: float = Field(..., ge=0, lt=360, description="Next house cusp in degrees")
     longitude: float = Field(..., ge=0, lt=360, description="Longitude in degrees")
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
-    size: float = Field(..., ge=0, lt=360, description="House size in degrees")
+    # Derived from the following house's cusp; only filled when a client asks for them
+    next_cusp: Optional[float] = Field(None, ge=0, lt=360, description="Next house cusp in degrees")
+    size: Optional[float] = Field(None, ge=0, lt=360, description="House size in degrees")
     ruler_ids: List[CelestialBody] = Field(default_factory=list, description="List of ruling planets")
 
 class Aspect(BaseModel):
     """Aspect between two celestial bodies."""
+    model_config = ConfigDict(frozen=True)
+
     body1: CelestialBody = Field(..., description="First celestial body")
     body2: CelestialBody = Field(..., description="Second celestial body")
     type: str = Field(..., description="Type of aspect")
@@ -95,6 +140,8 @@ class Aspect(BaseModel):
 
 class ChartAngles(BaseModel):
     """Angular points of the astrological chart."""
+    model_config = ConfigDict(frozen=True)
+
     ascendant: float = Field(..., ge=0, lt=360, description="Ascendant in degrees")
     midheaven: float = Field(..., ge=0, lt=360, description="Midheaven in degrees")
     descendant: float = Field(..., ge=0, lt=360, description="Descendant in degrees")
@@ -102,6 +149,8 @@ class ChartAngles(BaseModel):
 
 class BirthChart(BaseModel):
     """Complete birth chart information."""
+    model_config = ConfigDict(frozen=True)
+
     datetime: DateTime = Field(..., description="Date and time of birth")
     location: GeoPosition = Field(..., description="Location of birth")
     bodies: List[BodyPosition] = Field(..., description="List of celestial body positions")
@@ -113,6 +162,17 @@ class DateRange(BaseModel):
     start: DateTime
     end: DateTime
 
+    @model_validator(mode='after')
+    def validate_span(self) -> 'DateRange':
+        """Validate that the range runs forwards and is not too long."""
+        start = datetime_to_gmt(self.start)
+        end = datetime_to_gmt(self.end)
+        if start > end:
+            raise ValueError("Date range start must not be after its end")
+        if (end - start).days > _MAX_DATE_RANGE_DAYS:
+            raise ValueError(f"Date range must not span more than {_MAX_DATE_RANGE_DAYS} days")
+        return self
+
 class AstrologicalEvent(BaseModel):
     datetime: DateTime
     type: str
@@ -1,14 +1,13 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from ..models.astronomical import BirthChart, DateTime, GeoPosition, HouseSystem
-from ..services.kerykeion_service import KerykeionService
+from ..dependencies import kerykeion_service
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/birth-chart", tags=["birth-chart"])
-kerykeion_service = KerykeionService()
 
-@router.post("/calculate", response_model=BirthChart)
+@router.post("/calculate", response_model=BirthChart, response_model_exclude_unset=True)
 async def calculate_birth_chart(
     datetime: DateTime,
     location: GeoPosition,
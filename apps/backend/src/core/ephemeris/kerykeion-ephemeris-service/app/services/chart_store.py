@@ -0,0 +1,79 @@
+from typing import Optional, Tuple
+import hashlib
+import logging
+import sqlite3
+import threading
+from pydantic import ValidationError
+from ..models.astronomical import CHART_VERSION, BirthChart
+
+logger = logging.getLogger(__name__)
+
+class ChartStore:
+    """SQLite-backed birth chart cache shared by worker processes and kept across restarts.
+
+    Charts are stored as JSON under a hash of the service's chart cache key
+    and CHART_VERSION. Storage errors and unreadable rows are logged and
+    treated as misses, so a broken cache file never fails a request; a
+    database that cannot be opened disables the store.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database at path."""
+        self._path = path
+        # sqlite3 connections may not be shared across threads; each worker gets its own
+        self._local = threading.local()
+        self._enabled = True
+        try:
+            with self._connection() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS charts (key BLOB PRIMARY KEY, chart BLOB NOT NULL)")
+        except sqlite3.Error as e:
+            logger.warning(f"Chart store disabled, cannot open {path}: {str(e)}")
+            self._enabled = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0)
+            # WAL lets readers in other workers proceed while one worker writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _hash_key(key: Tuple) -> bytes:
+        """Stable digest of a cache key; its repr only holds ints, floats and strings.
+
+        CHART_VERSION is part of the digest, so charts stored by older
+        calculations are never served after it is bumped.
+        """
+        return hashlib.blake2b(repr((CHART_VERSION, key)).encode(), digest_size=16).digest()
+
+    def get(self, key: Tuple) -> Optional[BirthChart]:
+        """Return the stored chart for key, or None."""
+        if not self._enabled:
+            return None
+        try:
+            row = self._connection().execute(
+                "SELECT chart FROM charts WHERE key = ?", (self._hash_key(key),)
+            ).fetchone()
+            if row is None:
+                return None
+            return BirthChart.model_validate_json(row[0])
+        except (sqlite3.Error, ValidationError) as e:
+            logger.warning(f"Error reading chart store: {str(e)}")
+            return None
+
+    def put(self, key: Tuple, chart: BirthChart) -> None:
+        """Store chart under key."""
+        if not self._enabled:
+            return
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO charts (key, chart) VALUES (?, ?)",
+                    (self._hash_key(key), chart.model_dump_json(exclude_unset=True))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing chart store: {str(e)}")
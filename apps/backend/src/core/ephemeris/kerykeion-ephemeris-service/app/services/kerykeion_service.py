@@ -1,8 +1,15 @@
-from kerykeion import AstrologicalSubject, Planet, KerykeionPointModel
-from kerykeion.aspects import NatalAspects, SynastryAspects
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from kerykeion.utilities import check_and_adjust_polar_latitude
+from collections import OrderedDict
+from concurrent.futures import Executor
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Any, Optional, Set, Tuple
+import asyncio
 import logging
+import threading
+import kerykeion
+import numpy as np
 import swisseph as swe
 from ..models.astronomical import (
     BirthChart,
@@ -14,93 +21,533 @@ from ..models.astronomical import (
     House,
     Aspect,
     ChartAngles,
-    DateRange
+    DateRange,
+    datetime_to_gmt
 )
-import pytz
+from .chart_store import ChartStore
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
-class KerykeionService:
-    """Service for calculating birth charts using Kerykeion."""
+# Coordinates are rounded to 4 decimal places (~11 m) so floating point noise
+# in client input does not defeat the result caches.
+_COORDINATE_PRECISION = 4
 
-    def __init__(self):
-        """Initialize the service."""
-        self._instances = {}
-        swe.set_ephe_path()
+# Cache keys are flat tuples of primitives: cheap to build and hashed element-wise in C.
+# (year, month, day, hour, minute, second, lat, lng, house system)
+_ChartKey = Tuple[int, int, int, int, int, int, float, float, str]
+# (year, month, day, hour, minute, second, lat, lng)
+_AspectsKey = Tuple[int, int, int, int, int, int, float, float]
 
-    def _get_or_create_instance(self, datetime: DateTime, location: GeoPosition) -> AstrologicalSubject:
-        """Get or create a Kerykeion instance for the given datetime and location."""
-        try:
-            key = f"{datetime.year}-{datetime.month}-{datetime.day}-{datetime.hour}-{location.latitude}-{location.longitude}"
+# Upper bound on entries in each of a KerykeionService's result caches (charts, houses).
+# Keys keep whole seconds: house cusps move ~15 arcseconds per second of time,
+# so coarser time buckets would return visibly different charts.
+_CHART_CACHE_SIZE = 4096
+
+# Ephemeris files bundled with Kerykeion; our direct swe calls must read the
+# same data Kerykeion does.
+_EPHE_PATH = str(Path(kerykeion.__file__).parent / "sweph")
+
+# Swiss Ephemeris keeps its configuration per thread, so every worker thread
+# has to be pointed at the ephemeris files before its first calculation.
+_thread_state = threading.local()
+
+# Position + speed in one Swiss Ephemeris call.
+_SWE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Position only, for transit sweep samples; skipping the speed makes each call
+# several times cheaper.
+_SWE_POSITION_FLAGS = swe.FLG_SWIEPH
+
+# (body, Swiss Ephemeris planet number) for every body we report positions for.
+_SWE_BODIES = (
+    (CelestialBody.SUN, swe.SUN),
+    (CelestialBody.MOON, swe.MOON),
+    (CelestialBody.MERCURY, swe.MERCURY),
+    (CelestialBody.VENUS, swe.VENUS),
+    (CelestialBody.MARS, swe.MARS),
+    (CelestialBody.JUPITER, swe.JUPITER),
+    (CelestialBody.SATURN, swe.SATURN),
+    (CelestialBody.URANUS, swe.URANUS),
+    (CelestialBody.NEPTUNE, swe.NEPTUNE),
+    (CelestialBody.PLUTO, swe.PLUTO),
+    (CelestialBody.CHIRON, swe.CHIRON)
+)
+
+# Julian days spread over the 1900-2100 range DateTime accepts; warmup() reads
+# the ephemeris at each so the files are in the OS page cache before traffic.
+_WARMUP_JULIAN_DAYS = tuple(swe.julday(year, 1, 1, 0.0) for year in range(1900, 2101, 20))
+
+# Swiss Ephemeris house system codes.
+_HOUSE_CODE = {
+    HouseSystem.PLACIDUS: b'P',
+    HouseSystem.KOCH: b'K',
+    HouseSystem.PORPHYRIUS: b'O',
+    HouseSystem.REGIOMONTANUS: b'R',
+    HouseSystem.CAMPANUS: b'C',
+    HouseSystem.EQUAL: b'A',
+    HouseSystem.WHOLE_SIGN: b'W',
+    HouseSystem.MERIDIAN: b'X',
+    HouseSystem.MORINUS: b'M',
+    HouseSystem.TOPOCENTRIC: b'T'
+}
+
+# Traditional rulerships
+_HOUSE_RULERS = {
+    1: (CelestialBody.MARS,),  # Aries
+    2: (CelestialBody.VENUS,),  # Taurus
+    3: (CelestialBody.MERCURY,),  # Gemini
+    4: (CelestialBody.MOON,),  # Cancer
+    5: (CelestialBody.SUN,),  # Leo
+    6: (CelestialBody.MERCURY,),  # Virgo
+    7: (CelestialBody.VENUS,),  # Libra
+    8: (CelestialBody.PLUTO,),  # Scorpio
+    9: (CelestialBody.JUPITER,),  # Sagittarius
+    10: (CelestialBody.SATURN,),  # Capricorn
+    11: (CelestialBody.URANUS,),  # Aquarius
+    12: (CelestialBody.NEPTUNE,)  # Pisces
+}
+
+# Aspect table, in Kerykeion's settings order and indexed by aspect id.
+_ASPECT_NAMES = ("conjunction", "sextile", "quintile", "square", "trine", "opposition")
+_ASPECT_ID = {name: aspect_id for aspect_id, name in enumerate(_ASPECT_NAMES)}
+_ASPECT_DEGREES = np.array([0.0, 60.0, 72.0, 90.0, 120.0, 180.0])
+
+# Kerykeion's default natal orbs per aspect id, and the whole-degree windows they
+# give. The windows do not overlap, so each body pair matches at most one aspect.
+_NATAL_ORB_TABLE = np.array([10.0, 6.0, 1.0, 5.0, 8.0, 10.0])
+_NATAL_WINDOW_LOW = _ASPECT_DEGREES - _NATAL_ORB_TABLE
+_NATAL_WINDOW_HIGH = _ASPECT_DEGREES + _NATAL_ORB_TABLE
+
+# Transits check the major aspects only; every one uses the caller's orb.
+_TRANSIT_ASPECT_IDS = np.array([
+    _ASPECT_ID[name] for name in ("conjunction", "sextile", "square", "trine", "opposition")
+])
+_TRANSIT_ASPECT_DEGREES = _ASPECT_DEGREES[_TRANSIT_ASPECT_IDS]
+
+# Fastest apparent motion of each body over 1900-2100, in degrees per day and
+# in _SWE_BODIES order. Sweeps sample each body often enough that it cannot
+# move through an orb window between two samples.
+_TRANSIT_MAX_SPEED = np.array([
+    {
+        CelestialBody.SUN: 1.02,
+        CelestialBody.MOON: 15.4,
+        CelestialBody.MERCURY: 2.21,
+        CelestialBody.VENUS: 1.26,
+        CelestialBody.MARS: 0.8,
+        CelestialBody.JUPITER: 0.25,
+        CelestialBody.SATURN: 0.14,
+        CelestialBody.URANUS: 0.07,
+        CelestialBody.NEPTUNE: 0.05,
+        CelestialBody.PLUTO: 0.05,
+        CelestialBody.CHIRON: 0.15
+    }[body]
+    for body, _ in _SWE_BODIES
+])
+
+# Samples per NumPy batch in a transit sweep; bounds its memory at a few MB
+# however long the date range is.
+_TRANSIT_CHUNK_SAMPLES = 4096
+
+# Newton steps that move each sampled tightest orb onto the true minimum.
+_TRANSIT_REFINE_STEPS = 4
+
+# Transit sweeps longer than this many days run in a worker process, so the
+# NumPy work of several long sweeps can use more than one core.
+_TRANSIT_PROCESS_DAYS = 366
+
+def _ensure_ephe_path() -> None:
+    """Set the ephemeris path once for the calling thread."""
+    if not getattr(_thread_state, "ephe_path_set", False):
+        swe.set_ephe_path(_EPHE_PATH)
+        _thread_state.ephe_path_set = True
+
+def _make_chart_key(gmt_dt: datetime, location: GeoPosition, house_system: HouseSystem) -> _ChartKey:
+    """Chart cache key from GMT-normalized datetime components, rounded coordinates and the house system."""
+    return (
+        gmt_dt.year,
+        gmt_dt.month,
+        gmt_dt.day,
+        gmt_dt.hour,
+        gmt_dt.minute,
+        gmt_dt.second,
+        round(float(location.latitude), _COORDINATE_PRECISION),
+        round(float(location.longitude), _COORDINATE_PRECISION),
+        house_system.value
+    )
+
+def _make_aspects_key(gmt_dt: datetime, location: GeoPosition) -> _AspectsKey:
+    """Aspects cache key: a chart key without the house system, which aspects ignore."""
+    return _make_chart_key(gmt_dt, location, HouseSystem.PLACIDUS)[:-1]
+
+@lru_cache(maxsize=1024)
+def _julian_day(year: int, month: int, day: int, hour: int, minute: int, second: int) -> float:
+    """UT Julian day for GMT calendar components; computed once per instant."""
+    return swe.julday(year, month, day, hour + minute / 60 + second / 3600, swe.GREG_CAL)
+
+def _gmt_julian_day(gmt_dt: datetime) -> float:
+    """UT Julian day shared by the body and house calculations of one request."""
+    return _julian_day(gmt_dt.year, gmt_dt.month, gmt_dt.day, gmt_dt.hour, gmt_dt.minute, gmt_dt.second)
+
+def _signed_separation(lon1: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Signed shorter arc from lon2 to lon1, in [-180, 180)."""
+    return (lon1 - lon2 + 180.0) % 360.0 - 180.0
+
+def _is_applying(separation: np.ndarray, orbits: np.ndarray, relative_speed: np.ndarray) -> np.ndarray:
+    """Whether each aspect is tightening.
+
+    The arc |separation| changes at sign(separation) * relative_speed degrees
+    per day, and the orb |orbit| at sign(orbit) times that; an aspect applies
+    while its orb shrinks.
+    """
+    return np.sign(orbits) * np.sign(separation) * relative_speed < 0
+
+def _transit_orbit(jd: float, ipl: int, natal_lon: float, degrees: float) -> Tuple[float, float, float]:
+    """Signed orbit of a transiting body to a natal point at jd, with its signed separation and speed."""
+    lon, _, _, speed, _, _ = swe.calc_ut(jd, ipl, _SWE_FLAGS)[0]
+    separation = (lon - natal_lon + 180.0) % 360.0 - 180.0
+    # The arc |separation| changes at sign(separation) * speed; natal points are fixed
+    return abs(separation) - degrees, separation, speed
+
+def _refine_transit(
+    jd: float,
+    ipl: int,
+    natal_lon: float,
+    degrees: float,
+    low: float,
+    high: float
+) -> float:
+    """Move a sampled transit onto its tightest orb with Newton steps on the body's speed.
+
+    The search stays in [low, high], the samples either side of jd clipped to
+    the date range. Returns the signed orbit at the best time found, which is
+    never worse than at jd itself.
+    """
+    orbit, separation, speed = _transit_orbit(jd, ipl, natal_lon, degrees)
+    best = orbit
+    for _ in range(_TRANSIT_REFINE_STEPS):
+        rate = np.sign(separation) * speed
+        if rate == 0:
+            break
+        jd = min(max(jd - orbit / rate, low), high)
+        orbit, separation, speed = _transit_orbit(jd, ipl, natal_lon, degrees)
+        if abs(orbit) < abs(best):
+            best = orbit
+    return best
+
+def _sweep_transits(
+    jd_start: float,
+    jd_end: float,
+    natal_lon: List[float],
+    orb: float
+) -> List[Tuple[int, int, int, float, float, bool]]:
+    """Find transit aspects over a date range; module-level so worker processes can run it.
+
+    Each transiting body is sampled from jd_start to jd_end at a step short
+    enough that it spends at least two samples inside any orb window: about
+    every 1.5 hours for the Moon at a 1° orb, at most daily for the rest. Samples are tested in
+    fixed-size batches, each as one (sample, natal body, aspect) NumPy
+    broadcast. The tightest sample per aspect is then refined with Newton
+    steps on the body's speed.
+
+    Returns (transiting body index, natal body index, aspect id, tightest
+    signed orbit, signed orbit at jd_start, applying at jd_start) per aspect.
+    Most aspects perfect inside a range, so the tightest orbit is about zero
+    and says nothing about direction; applying is read at jd_start instead.
+    """
+    _ensure_ephe_path()
+    
+    natal = np.array(natal_lon)
+    span = jd_end - jd_start
+    hits = []
+    for t, (_, ipl) in enumerate(_SWE_BODIES):
+        step = min(1.0, orb / _TRANSIT_MAX_SPEED[t])
+        samples = int(np.ceil(span / step)) + 1
+        best_score = np.full((len(natal), len(_TRANSIT_ASPECT_DEGREES)), np.inf)
+        best_jd = np.zeros_like(best_score)
+        
+        for first in range(0, samples, _TRANSIT_CHUNK_SAMPLES):
+            # The last sample lands on jd_end so the whole range is covered;
+            # transits are geocentric, so the natal location does not enter
+            jds = np.minimum(jd_start + step * np.arange(first, min(first + _TRANSIT_CHUNK_SAMPLES, samples)), jd_end)
+            transit_lon = np.array([swe.calc_ut(jd, ipl, _SWE_POSITION_FLAGS)[0][0] for jd in jds.tolist()])
             
-            if key not in self._instances:
-                logger.info(f"Creating new AstrologicalSubject for {key}")
-                self._instances[key] = AstrologicalSubject(
-                    name="User",
-                    year=datetime.year,
-                    month=datetime.month,
-                    day=datetime.day,
-                    hour=datetime.hour,
-                    minute=datetime.minute,
-                    lat=float(location.latitude),  # Ensure float type
-                    lng=float(location.longitude),  # Ensure float type
-                    tz_str=datetime.timezone
-                )
+            # Shorter arc to every natal body at every sample
+            arc = np.abs(_signed_separation(transit_lon[:, None], natal[None, :]))[..., None]
             
-            return self._instances[key]
-        except Exception as e:
-            logger.error(f"Error creating AstrologicalSubject: {str(e)}", exc_info=True)
-            raise
+            # Kerykeion matches the first aspect whose window holds the whole degrees
+            # of the arc, then our orb limit applies to the exact signed orbit
+            whole = np.floor(arc)
+            matches = (
+                (whole >= _TRANSIT_ASPECT_DEGREES - orb)
+                & (whole <= _TRANSIT_ASPECT_DEGREES + orb)
+            )
+            matches &= np.cumsum(matches, axis=-1) == 1
+            orbits = arc - _TRANSIT_ASPECT_DEGREES
+            matches &= np.abs(orbits) <= orb
+            
+            # Keep the tightest sample per (natal body, aspect) across batches
+            score = np.where(matches, np.abs(orbits), np.inf)
+            chunk_best = score.argmin(axis=0)
+            chunk_score = np.take_along_axis(score, chunk_best[None], axis=0)[0]
+            better = chunk_score < best_score
+            best_score[better] = chunk_score[better]
+            best_jd[better] = jds[chunk_best][better]
+        
+        for n, a in zip(*np.nonzero(np.isfinite(best_score))):
+            jd = float(best_jd[n, a])
+            degrees = float(_TRANSIT_ASPECT_DEGREES[a])
+            orbit = _refine_transit(
+                jd,
+                ipl,
+                natal_lon[n],
+                degrees,
+                max(jd - step, jd_start),
+                min(jd + step, jd_end)
+            )
+            start_orbit, separation, speed = _transit_orbit(jd_start, ipl, natal_lon[n], degrees)
+            applying = bool(_is_applying(np.float64(separation), np.float64(start_orbit), np.float64(speed)))
+            hits.append((t, int(n), int(_TRANSIT_ASPECT_IDS[a]), orbit, start_orbit, applying))
+    return hits
+
+class KerykeionService:
+    """Service for calculating birth charts straight from Swiss Ephemeris."""
+
+    def __init__(self, chart_store_path: Optional[str] = None):
+        """Initialize the service.
+
+        chart_store_path, when given, backs the in-memory chart cache with a
+        SQLite file that survives restarts and is shared by every worker using it.
+        """
+        _ensure_ephe_path()
+        self._chart_store = ChartStore(chart_store_path) if chart_store_path else None
+        # Charts are deterministic for a given key, so entries never need invalidation
+        self._chart_cache: OrderedDict[_ChartKey, BirthChart] = OrderedDict()
+        self._houses_cache: OrderedDict[_ChartKey, List[House]] = OrderedDict()
+        self._aspects_cache: OrderedDict[_AspectsKey, List[Aspect]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Process pool for long transit sweeps. The app lifespan owns it; with
+        # none set, long sweeps run in a worker thread like short ones.
+        self.transit_pool: Optional[Executor] = None
 
-    def _get_point_data(self, point: KerykeionPointModel) -> Dict[str, Any]:
-        """Extract relevant data from a Kerykeion point."""
-        return {
-            'longitude': point.abs_pos,
-            'is_retrograde': point.retrograde
-        }
+    def warmup(self) -> None:
+        """Read the ephemeris across the supported date range ahead of the first request.
+
+        Swiss Ephemeris file handles are per thread, so worker threads still open
+        their own; what this saves them is reading the data from disk.
+        """
+        _ensure_ephe_path()
+        for jd in _WARMUP_JULIAN_DAYS:
+            for _, ipl in _SWE_BODIES:
+                swe.calc_ut(jd, ipl, _SWE_FLAGS)
+        swe.houses_ex(_WARMUP_JULIAN_DAYS[0], 0.0, 0.0, _HOUSE_CODE[HouseSystem.PLACIDUS])
+        logger.info("Swiss Ephemeris warmed up")
 
     def _get_house_rulers(self, house_number: int) -> List[CelestialBody]:
         """Calculate house rulers based on traditional rulerships."""
-        # Traditional rulerships
-        rulers = {
-            1: [CelestialBody.MARS],  # Aries
-            2: [CelestialBody.VENUS],  # Taurus
-            3: [CelestialBody.MERCURY],  # Gemini
-            4: [CelestialBody.MOON],  # Cancer
-            5: [CelestialBody.SUN],  # Leo
-            6: [CelestialBody.MERCURY],  # Virgo
-            7: [CelestialBody.VENUS],  # Libra
-            8: [CelestialBody.PLUTO],  # Scorpio
-            9: [CelestialBody.JUPITER],  # Sagittarius
-            10: [CelestialBody.SATURN],  # Capricorn
-            11: [CelestialBody.URANUS],  # Aquarius
-            12: [CelestialBody.NEPTUNE]  # Pisces
-        }
-        return rulers.get(house_number, [])
+        return list(_HOUSE_RULERS.get(house_number, ()))
 
     def _calculate_house_size(self, cusp1: float, cusp2: float) -> float:
         """Calculate house size, handling 0/360 boundary correctly."""
-        if cusp2 < cusp1:
-            cusp2 += 360
-        return cusp2 - cusp1
+        return (cusp2 - cusp1) % 360.0
+
+    def expand_houses(self, houses: List[House], fields: Set[str]) -> List[House]:
+        """Return copies of houses with the requested derived fields filled in.
+
+        Cached houses only carry their own cusp; next_cusp and size follow from
+        the next house, so they are added here for the clients that want them.
+        """
+        if not fields:
+            return houses
+        expanded = []
+        for i, house in enumerate(houses):
+            next_cusp = houses[(i + 1) % len(houses)].cusp
+            update = {}
+            if "next_cusp" in fields:
+                update["next_cusp"] = next_cusp
+            if "size" in fields:
+                update["size"] = self._calculate_house_size(house.cusp, next_cusp)
+            expanded.append(house.model_copy(update=update))
+        return expanded
+
+    def _cache_get(self, cache: OrderedDict, key: Tuple) -> Optional[Any]:
+        """Return the cached value for key, marking it most recently used."""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
 
-    def _convert_to_gmt(self, dt: datetime, timezone: str) -> datetime:
-        """Convert a datetime from any timezone to GMT."""
+    def _cache_put(self, cache: OrderedDict, key: Tuple, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > _CHART_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _calculate_houses_and_angles(
+        self,
+        jd: float,
+        location: GeoPosition,
+        house_system: HouseSystem
+    ) -> Tuple[List[House], ChartAngles]:
+        """Calculate houses and chart angles for a UT Julian day from one swe.houses_ex call."""
+        houses = []
         try:
-            # Create timezone object
-            tz = pytz.timezone(timezone)
-            
-            # Localize the datetime to the input timezone
-            local_dt = tz.localize(dt)
-            
-            # Convert to GMT
-            gmt_dt = local_dt.astimezone(pytz.UTC)
+            # Same polar-circle clamp Kerykeion applies, so quadrant systems stay defined
+            cusps, ascmc = swe.houses_ex(
+                jd,
+                check_and_adjust_polar_latitude(float(location.latitude)),
+                float(location.longitude),
+                _HOUSE_CODE[house_system]
+            )
             
-            return gmt_dt
+            for i in range(12):
+                cusp = cusps[i]
+                house_obj = House.model_construct(
+                    number=i + 1,
+                    cusp=cusp,
+                    longitude=cusp,
+                    latitude=0,
+                    ruler_ids=self._get_house_rulers(i + 1)
+                )
+                houses.append(house_obj)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("House %d: Cusp=%.2f°", house_obj.number, house_obj.cusp)
         except Exception as e:
-            logger.error(f"Error converting timezone: {str(e)}", exc_info=True)
+            logger.error(f"Error getting house data: {str(e)}", exc_info=True)
             raise
+        
+        # Descendant and IC sit opposite the Ascendant and MC
+        ascendant, midheaven = ascmc[0], ascmc[1]
+        angles = ChartAngles.model_construct(
+            ascendant=ascendant,
+            midheaven=midheaven,
+            descendant=(ascendant + 180.0) % 360.0,
+            imum_coeli=(midheaven + 180.0) % 360.0
+        )
+        return houses, angles
+
+    async def calculate_houses(
+        self,
+        birth_datetime: DateTime,
+        location: GeoPosition,
+        house_system: HouseSystem = HouseSystem.PLACIDUS
+    ) -> List[House]:
+        """Calculate house cusps only, without body positions or aspects."""
+        key = _make_chart_key(datetime_to_gmt(birth_datetime), location, house_system)
+        houses = self._cache_get(self._houses_cache, key)
+        if houses is not None:
+            return houses
+        
+        chart = self._cache_get(self._chart_cache, key)
+        if chart is not None:
+            houses = chart.houses
+        else:
+            houses = await asyncio.to_thread(
+                self._calculate_houses_sync,
+                birth_datetime,
+                location,
+                house_system
+            )
+        self._cache_put(self._houses_cache, key, houses)
+        return houses
+
+    def _calculate_houses_sync(
+        self,
+        birth_datetime: DateTime,
+        location: GeoPosition,
+        house_system: HouseSystem
+    ) -> List[House]:
+        """Calculate houses; blocking, run off the event loop by calculate_houses."""
+        _ensure_ephe_path()
+        gmt_dt = datetime_to_gmt(birth_datetime)
+        logger.debug("Calculating houses for %s at %s", gmt_dt, location)
+        return self._calculate_houses_and_angles(_gmt_julian_day(gmt_dt), location, house_system)[0]
+
+    def _calculate_bodies(self, jd: float) -> List[BodyPosition]:
+        """Calculate body positions for a UT Julian day straight from Swiss Ephemeris."""
+        return [
+            BodyPosition.model_construct(
+                id=body,
+                longitude=lon,
+                latitude=lat,
+                distance=dist,
+                speed=speed,
+                is_retrograde=speed < 0
+            )
+            for body, ipl in _SWE_BODIES
+            for lon, lat, dist, speed, _, _ in (swe.calc_ut(jd, ipl, _SWE_FLAGS)[0],)
+        ]
+
+    def _calculate_natal_aspects(self, bodies: List[BodyPosition], exact_orb: float = 1) -> List[Aspect]:
+        """Calculate natal aspects over all body pairs at once.
+
+        Follows Kerykeion's NatalAspects rules: the shorter arc between two bodies
+        matches an aspect when its whole degrees fall within the aspect's orb, and
+        the signed orbit is the arc minus the aspect angle. Applying is decided
+        from the bodies' relative speed.
+        """
+        lon = np.array([body.longitude for body in bodies])
+        speed = np.array([body.speed for body in bodies])
+        first, second = np.triu_indices(len(bodies), k=1)
+        separation = _signed_separation(lon[first], lon[second])
+        arc = np.abs(separation)
+        whole = np.floor(arc)[:, None]
+        matches = (
+            (whole >= _NATAL_WINDOW_LOW)
+            & (whole <= _NATAL_WINDOW_HIGH)
+        )
+        pair_idx, aspect_idx = np.nonzero(matches)
+        orbits = arc[pair_idx] - _ASPECT_DEGREES[aspect_idx]
+        applying = _is_applying(
+            separation[pair_idx],
+            orbits,
+            speed[first[pair_idx]] - speed[second[pair_idx]]
+        )
+        
+        aspects = [
+            Aspect.model_construct(
+                body1=bodies[i].id,
+                body2=bodies[j].id,
+                type=_ASPECT_NAMES[k],
+                orb=abs(orbit),
+                exact=abs(orbit) <= exact_orb,
+                applying=is_applying
+            )
+            for i, j, k, orbit, is_applying in zip(
+                first[pair_idx].tolist(),
+                second[pair_idx].tolist(),
+                aspect_idx.tolist(),
+                orbits.tolist(),
+                applying.tolist()
+            )
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            for aspect_obj in aspects:
+                logger.debug("Aspect: %s %s %s (Orb=%.2f°, Exact=%s)", aspect_obj.body1.value, aspect_obj.type, aspect_obj.body2.value, aspect_obj.orb, aspect_obj.exact)
+        return aspects
+
+    async def calculate_aspects(
+        self,
+        birth_datetime: DateTime,
+        location: GeoPosition
+    ) -> List[Aspect]:
+        """Calculate natal aspects only, without house cusps or the chart response."""
+        gmt_dt = datetime_to_gmt(birth_datetime)
+        key = _make_aspects_key(gmt_dt, location)
+        aspects = self._cache_get(self._aspects_cache, key)
+        if aspects is None:
+            aspects = await asyncio.to_thread(self._calculate_aspects_sync, gmt_dt, location)
+            self._cache_put(self._aspects_cache, key, aspects)
+        return aspects
+
+    def _calculate_aspects_sync(self, gmt_dt: datetime, location: GeoPosition) -> List[Aspect]:
+        """Calculate aspects; blocking, run off the event loop by calculate_aspects."""
+        _ensure_ephe_path()
+        logger.debug("Calculating aspects for %s at %s", gmt_dt, location)
+        return self._calculate_natal_aspects(self._calculate_bodies(_gmt_julian_day(gmt_dt)))
 
     async def calculate_birth_chart(
         self,
@@ -108,21 +555,63 @@ class KerykeionService:
         location: GeoPosition,
         house_system: HouseSystem = HouseSystem.PLACIDUS
     ) -> BirthChart:
-        """Calculate a complete birth chart using Kerykeion."""
+        """Calculate a complete birth chart."""
+        key = _make_chart_key(datetime_to_gmt(birth_datetime), location, house_system)
+        chart = self._cache_get(self._chart_cache, key)
+        if chart is not None:
+            logger.debug("Returning cached birth chart for %s at %s", birth_datetime, location)
+        else:
+            chart = await asyncio.to_thread(
+                self._load_or_calculate_birth_chart,
+                key,
+                birth_datetime,
+                location,
+                house_system
+            )
+            self._cache_put(self._chart_cache, key, chart)
+        
+        if chart.location != location:
+            # Coordinates matched after rounding; echo the caller's location
+            chart = chart.model_copy(update={"location": location})
+        return chart
+
+    def _load_or_calculate_birth_chart(
+        self,
+        key: _ChartKey,
+        birth_datetime: DateTime,
+        location: GeoPosition,
+        house_system: HouseSystem
+    ) -> BirthChart:
+        """Read a chart from the chart store, calculating and storing it on a miss."""
+        if self._chart_store is not None:
+            chart = self._chart_store.get(key)
+            if chart is not None:
+                logger.info(f"Loaded birth chart for {birth_datetime} at {location} from the chart store")
+                return chart
+        
+        chart = self._calculate_birth_chart_sync(birth_datetime, location, house_system)
+        if self._chart_store is not None:
+            self._chart_store.put(key, chart)
+        return chart
+
+    def _calculate_birth_chart_sync(
+        self,
+        birth_datetime: DateTime,
+        location: GeoPosition,
+        house_system: HouseSystem
+    ) -> BirthChart:
+        """Calculate a birth chart; blocking, run off the event loop by calculate_birth_chart."""
         try:
+            _ensure_ephe_path()
+            
             # Convert input datetime to GMT
-            local_dt = datetime(
-                birth_datetime.year,
-                birth_datetime.month,
-                birth_datetime.day,
-                birth_datetime.hour,
-                birth_datetime.minute,
-                birth_datetime.second or 0
-            )
-            gmt_dt = self._convert_to_gmt(local_dt, birth_datetime.timezone)
+            gmt_dt = datetime_to_gmt(birth_datetime)
             
-            # Create GMT DateTime object for Kerykeion
-            gmt_datetime = DateTime(
+            # Result models below use model_construct: every value comes from our own
+            # Swiss Ephemeris calls, so field validation would only re-check it
+            
+            # GMT DateTime echoed back in the response
+            gmt_datetime = DateTime.model_construct(
                 year=gmt_dt.year,
                 month=gmt_dt.month,
                 day=gmt_dt.day,
@@ -133,131 +622,32 @@ class KerykeionService:
             )
             
             logger.info(f"Calculating birth chart for {gmt_datetime} (converted from {birth_datetime.timezone}) at {location}")
-            instance = self._get_or_create_instance(gmt_datetime, location)
-            
-            # Calculate angles
-            logger.info("Calculating angles")
-            try:
-                angles = ChartAngles(
-                    ascendant=instance.ascendant.abs_pos,
-                    midheaven=instance.medium_coeli.abs_pos,
-                    descendant=instance.descendant.abs_pos,
-                    imum_coeli=instance.imum_coeli.abs_pos
-                )
-                logger.info(f"Calculated angles: Ascendant={angles.ascendant:.2f}°, MC={angles.midheaven:.2f}°, DC={angles.descendant:.2f}°, IC={angles.imum_coeli:.2f}°")
-            except Exception as e:
-                logger.error(f"Error calculating angles: {str(e)}", exc_info=True)
-                raise
             
             # Calculate body positions
             logger.info("Calculating body positions")
-            bodies = []
+            jd = _gmt_julian_day(gmt_dt)
             try:
-                for body in CelestialBody:
-                    try:
-                        logger.debug(f"Getting data for body: {body.value}")
-                        planet = getattr(instance, body.value.lower(), None)
-                        if planet and isinstance(planet, KerykeionPointModel):
-                            data = self._get_point_data(planet)
-                            body_pos = BodyPosition(
-                                id=body,
-                                longitude=data['longitude'],
-                                latitude=0,  # Not needed for basic calculations
-                                distance=0,  # Not needed for basic calculations
-                                speed=0,  # Not needed for basic calculations
-                                is_retrograde=data['is_retrograde']
-                            )
-                            bodies.append(body_pos)
-                            logger.info(f"Body {body.value}: Longitude={body_pos.longitude:.2f}°, Retrograde={body_pos.is_retrograde}")
-                    except Exception as e:
-                        logger.warning(f"Error calculating position for {body.value}: {str(e)}")
-                        continue
+                bodies = self._calculate_bodies(jd)
             except Exception as e:
-                logger.error(f"Error getting body data: {str(e)}", exc_info=True)
+                logger.error(f"Error calculating body positions: {str(e)}", exc_info=True)
                 raise
             
-            # Calculate houses
-            logger.info("Calculating houses")
-            houses = []
-            try:
-                house_attrs = [
-                    instance.first_house,
-                    instance.second_house,
-                    instance.third_house,
-                    instance.fourth_house,
-                    instance.fifth_house,
-                    instance.sixth_house,
-                    instance.seventh_house,
-                    instance.eighth_house,
-                    instance.ninth_house,
-                    instance.tenth_house,
-                    instance.eleventh_house,
-                    instance.twelfth_house
-                ]
-                
-                for i, house in enumerate(house_attrs, 1):
-                    try:
-                        if not isinstance(house, KerykeionPointModel):
-                            continue
-                            
-                        next_house = house_attrs[i] if i < 12 else house_attrs[0]
-                        if not isinstance(next_house, KerykeionPointModel):
-                            continue
-                        
-                        house_obj = House(
-                            number=i,
-                            cusp=house.abs_pos,
-                            next_cusp=next_house.abs_pos,
-                            longitude=house.abs_pos,
-                            latitude=0,
-                            size=self._calculate_house_size(house.abs_pos, next_house.abs_pos),
-                            ruler_ids=self._get_house_rulers(i)
-                        )
-                        houses.append(house_obj)
-                        logger.info(f"House {i}: Cusp={house_obj.cusp:.2f}°, Next Cusp={house_obj.next_cusp:.2f}°, Size={house_obj.size:.2f}°, Rulers={[r.value for r in house_obj.ruler_ids]}")
-                    except Exception as e:
-                        logger.warning(f"Error calculating house {i}: {str(e)}")
-                        continue
-            except Exception as e:
-                logger.error(f"Error getting house data: {str(e)}", exc_info=True)
-                raise
+            # Calculate houses and angles
+            logger.info("Calculating houses and angles")
+            houses, angles = self._calculate_houses_and_angles(jd, location, house_system)
+            logger.debug("Calculated angles: Ascendant=%.2f°, MC=%.2f°, DC=%.2f°, IC=%.2f°", angles.ascendant, angles.midheaven, angles.descendant, angles.imum_coeli)
             
             # Calculate aspects
             logger.info("Calculating aspects")
             aspects = []
             try:
-                natal_aspects = NatalAspects(instance)
-                for aspect in natal_aspects.relevant_aspects:
-                    try:
-                        # Skip invalid celestial bodies
-                        if aspect.p1_name.upper() not in [b.value for b in CelestialBody] or \
-                           aspect.p2_name.upper() not in [b.value for b in CelestialBody]:
-                            continue
-                            
-                        # Ensure orb is positive
-                        orb = aspect.orbit
-                        is_applying = orb < 0  # Negative orb means applying
-                        orb = abs(orb)  # Use positive orb for exactness check
-                        
-                        aspect_obj = Aspect(
-                            body1=CelestialBody(aspect.p1_name.upper()),
-                            body2=CelestialBody(aspect.p2_name.upper()),
-                            type=aspect.aspect,
-                            orb=orb,
-                            exact=orb <= 1,
-                            applying=is_applying
-                        )
-                        aspects.append(aspect_obj)
-                        logger.info(f"Aspect: {aspect_obj.body1.value} {aspect_obj.type} {aspect_obj.body2.value} (Orb={aspect_obj.orb:.2f}°, Exact={aspect_obj.exact})")
-                    except Exception as e:
-                        logger.warning(f"Error processing aspect: {str(e)}")
-                        continue
+                aspects = self._calculate_natal_aspects(bodies)
             except Exception as e:
                 logger.error(f"Error calculating aspects: {str(e)}", exc_info=True)
                 # Don't raise here, aspects are optional
             
             logger.info("Creating BirthChart response")
-            return BirthChart(
+            return BirthChart.model_construct(
                 datetime=gmt_datetime,
                 location=location,
                 bodies=bodies,
@@ -275,100 +665,39 @@ class KerykeionService:
         date_range: DateRange,
         orb: float = 1.0
     ) -> List[Aspect]:
-        """Calculate transits for a given birth chart and date range."""
+        """Calculate transits to a birth chart over a date range.
+
+        Each aspect is reported once, with the tightest orb it reaches within
+        the range; exact and applying describe it at the start of the range.
+        Sweeps run off the event loop; long ones go to a worker process.
+        """
         try:
             logger.info(f"Calculating transits for date range: {date_range}")
+            jd_start = _gmt_julian_day(datetime_to_gmt(date_range.start))
+            jd_end = _gmt_julian_day(datetime_to_gmt(date_range.end))
+            natal_lon = [body.longitude for body in natal_chart.bodies]
             
-            # Create natal instance from birth chart data
-            natal_dt = datetime(
-                year=natal_chart.datetime.year,
-                month=natal_chart.datetime.month,
-                day=natal_chart.datetime.day,
-                hour=natal_chart.datetime.hour,
-                minute=natal_chart.datetime.minute,
-                second=natal_chart.datetime.second or 0
-            )
-            
-            natal_instance = AstrologicalSubject(
-                name="Natal",
-                year=natal_dt.year,
-                month=natal_dt.month,
-                day=natal_dt.day,
-                hour=natal_dt.hour,
-                minute=natal_dt.minute,
-                lat=float(natal_chart.location.latitude),
-                lng=float(natal_chart.location.longitude),
-                tz_str=natal_chart.datetime.timezone
-            )
-            
-            # Create transit instance
-            transit_dt = datetime(
-                year=date_range.start.year,
-                month=date_range.start.month,
-                day=date_range.start.day,
-                hour=date_range.start.hour,
-                minute=date_range.start.minute,
-                second=date_range.start.second or 0
-            )
-            
-            transit_instance = AstrologicalSubject(
-                name="Transit",
-                year=transit_dt.year,
-                month=transit_dt.month,
-                day=transit_dt.day,
-                hour=transit_dt.hour,
-                minute=transit_dt.minute,
-                lat=float(natal_chart.location.latitude),  # Use same location as birth chart
-                lng=float(natal_chart.location.longitude),
-                tz_str=date_range.start.timezone
-            )
+            if self.transit_pool is not None and jd_end - jd_start > _TRANSIT_PROCESS_DAYS:
+                hits = await asyncio.get_running_loop().run_in_executor(
+                    self.transit_pool, _sweep_transits, jd_start, jd_end, natal_lon, orb
+                )
+            else:
+                hits = await asyncio.to_thread(_sweep_transits, jd_start, jd_end, natal_lon, orb)
             
-            # Use Kerykeion's SynastryAspects for transit calculations
-            active_aspects = [
-                {"name": "conjunction", "orb": orb},
-                {"name": "opposition", "orb": orb},
-                {"name": "trine", "orb": orb},
-                {"name": "sextile", "orb": orb},
-                {"name": "square", "orb": orb}
+            aspects = [
+                Aspect.model_construct(
+                    body1=_SWE_BODIES[t][0],
+                    body2=natal_chart.bodies[n].id,
+                    type=_ASPECT_NAMES[k],
+                    orb=abs(orbit),
+                    exact=abs(start_orbit) <= 0.1,
+                    applying=applying
+                )
+                for t, n, k, orbit, start_orbit, applying in hits
             ]
-            
-            synastry_aspects = SynastryAspects(
-                transit_instance,
-                natal_instance,
-                active_aspects=active_aspects
-            )
-            
-            # Convert Kerykeion aspects to our Aspect model
-            aspects = []
-            for aspect in synastry_aspects.relevant_aspects:
-                try:
-                    # Skip invalid celestial bodies
-                    if aspect.p1_name.upper() not in [b.value for b in CelestialBody] or \
-                       aspect.p2_name.upper() not in [b.value for b in CelestialBody]:
-                        continue
-                    
-                    # Skip aspects with orbs larger than our limit
-                    if abs(aspect.orbit) > orb:
-                        continue
-
-                    # Ensure orb is positive
-                    orb_value = abs(aspect.orbit)
-                    is_applying = aspect.orbit < 0  # Negative orb means applying
-                    
-                    aspect_obj = Aspect(
-                        body1=CelestialBody(aspect.p1_name.upper()),
-                        body2=CelestialBody(aspect.p2_name.upper()),
-                        type=aspect.aspect,
-                        orb=orb_value,
-                        exact=orb_value <= 0.1,  # Consider exact if orb <= 0.1 degrees
-                        applying=is_applying
-                    )
-                    aspects.append(aspect_obj)
-                    logger.info(f"Transit Aspect: {aspect_obj.body1.value} {aspect_obj.type} Natal {aspect_obj.body2.value} "
-                              f"(Orb={aspect_obj.orb:.2f}°, Exact={aspect_obj.exact}, Applying={aspect_obj.applying})")
-                except Exception as e:
-                    logger.warning(f"Error processing transit aspect: {str(e)}")
-                    continue
+            if logger.isEnabledFor(logging.DEBUG):
+                for aspect_obj in aspects:
+                    logger.debug("Transit Aspect: %s %s Natal %s (Orb=%.2f°, Exact=%s, Applying=%s)", aspect_obj.body1.value, aspect_obj.type, aspect_obj.body2.value, aspect_obj.orb, aspect_obj.exact, aspect_obj.applying)
             
             return aspects
             
@@ -5,9 +5,13 @@ import pytz
 from app.main import app
 from app.models.astronomical import DateTime, GeoPosition, HouseSystem, CelestialBody
 
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def client():
+    """Share one TestClient; entering it runs the app's ephemeris warmup once."""
+    with TestClient(app) as test_client:
+        yield test_client
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_datetime():
     """Create a test datetime for Mumbai."""
     mumbai_tz = pytz.timezone('Asia/Kolkata')
@@ -18,10 +22,11 @@ def test_datetime():
         day=dt.day,
         hour=dt.hour,
         minute=dt.minute,
+        second=dt.second,
         timezone=dt.tzinfo.zone
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_location():
     """Create a test location for Mumbai."""
     return GeoPosition(
@@ -29,13 +34,13 @@ def test_location():
         longitude=72.8777
     )
 
-def test_health_check():
+def test_health_check(client):
     """Test the health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
-def test_calculate_birth_chart(test_datetime, test_location):
+def test_calculate_birth_chart(client, test_datetime, test_location):
     """Test the birth chart calculation endpoint."""
     response = client.post(
         "/api/v1/ephemeris/birth-chart",
@@ -52,7 +57,46 @@ def test_calculate_birth_chart(test_datetime, test_location):
     assert "houses" in data
     assert "aspects" in data
 
-def test_calculate_houses(test_datetime, test_location):
+def test_birth_chart_etag(client, test_datetime, test_location):
+    """GET charts carry an ETag and a repeat with If-None-Match gets a 304 without a body."""
+    params = {**test_datetime.model_dump(), **test_location.model_dump(exclude_unset=True)}
+    response = client.get("/api/v1/ephemeris/birth-chart", params=params)
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+
+    posted = client.post(
+        "/api/v1/ephemeris/birth-chart",
+        json={"datetime": test_datetime.dict(), "location": test_location.dict()}
+    )
+    assert response.json() == posted.json()
+    assert response.headers["x-chart-signature"] == posted.headers["x-chart-signature"]
+
+    cached = client.get("/api/v1/ephemeris/birth-chart", params=params, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    other = client.get(
+        "/api/v1/ephemeris/birth-chart",
+        params={**params, "house_system": HouseSystem.KOCH.value},
+        headers={"If-None-Match": etag}
+    )
+    assert other.status_code == 200
+    assert other.headers["etag"] != etag
+
+    invalid = client.get("/api/v1/ephemeris/birth-chart", params={**params, "latitude": 91})
+    assert invalid.status_code == 422
+
+def test_birth_chart_post_not_cached(client, test_datetime, test_location):
+    """POST charts advertise no cache semantics and ignore If-None-Match."""
+    payload = {"datetime": test_datetime.dict(), "location": test_location.dict()}
+    response = client.post("/api/v1/ephemeris/birth-chart", json=payload, headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
+
+def test_calculate_houses(client, test_datetime, test_location):
     """Test the houses calculation endpoint."""
     response = client.post(
         "/api/v1/ephemeris/houses",
@@ -66,17 +110,20 @@ def test_calculate_houses(test_datetime, test_location):
     data = response.json()
     assert len(data) == 12  # Should have 12 houses
 
-def test_calculate_aspects():
+def test_calculate_aspects(client, test_datetime, test_location):
     """Test the aspects calculation endpoint."""
     response = client.post(
         "/api/v1/ephemeris/aspects",
         json={
-            "bodies": [CelestialBody.SUN.value, CelestialBody.MOON.value]
+            "datetime": test_datetime.dict(),
+            "location": test_location.dict()
         }
     )
-    assert response.status_code == 501  # Should be NotImplementedError
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
 
-def test_calculate_transits(test_datetime, test_location):
+def test_calculate_transits(client, test_datetime, test_location):
     """Test the transits calculation endpoint."""
     # First get a birth chart
     birth_chart_response = client.post(
@@ -100,9 +147,98 @@ def test_calculate_transits(test_datetime, test_location):
             }
         }
     )
-    assert response.status_code == 501  # Should be NotImplementedError
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+def test_calculate_transits_signed(client, test_datetime, test_location):
+    """A signed chart skips validation; an unsigned or altered one is validated."""
+    birth_chart_response = client.post(
+        "/api/v1/ephemeris/birth-chart",
+        json={
+            "datetime": test_datetime.dict(),
+            "location": test_location.dict()
+        }
+    )
+    birth_chart = birth_chart_response.json()
+    date_range = {"start": test_datetime.dict(), "end": test_datetime.dict()}
+
+    signed = client.post(
+        "/api/v1/ephemeris/transits-signed",
+        json={
+            "natal_chart": birth_chart,
+            "signature": birth_chart_response.headers["x-chart-signature"],
+            "date_range": date_range
+        }
+    )
+    unsigned = client.post(
+        "/api/v1/ephemeris/transits",
+        json={"natal_chart": birth_chart, "date_range": date_range}
+    )
+    assert signed.status_code == 200
+    assert signed.json() == unsigned.json()
+
+    birth_chart["bodies"][0]["longitude"] = 400.0
+    tampered = client.post(
+        "/api/v1/ephemeris/transits-signed",
+        json={
+            "natal_chart": birth_chart,
+            "signature": birth_chart_response.headers["x-chart-signature"],
+            "date_range": date_range
+        }
+    )
+    assert tampered.status_code == 422
+
+def test_calculate_transits_by_natal_inputs(client, test_datetime, test_location):
+    """Test the transits endpoint that takes birth data instead of a chart."""
+    response = client.post(
+        "/api/v1/ephemeris/transits-by-natal-inputs",
+        json={
+            "datetime": test_datetime.dict(),
+            "location": test_location.dict(),
+            "date_range": {
+                "start": test_datetime.dict(),
+                "end": test_datetime.dict()
+            }
+        }
+    )
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+def test_transits_date_range_validation(client, test_datetime, test_location):
+    """Reversed and over-long date ranges are rejected before any sweep runs."""
+    later = test_datetime.model_copy(update={"year": test_datetime.year + 1})
+    much_later = test_datetime.model_copy(update={"year": test_datetime.year + 11})
+    for start, end in ((later, test_datetime), (test_datetime, much_later)):
+        response = client.post(
+            "/api/v1/ephemeris/transits-by-natal-inputs",
+            json={
+                "datetime": test_datetime.dict(),
+                "location": test_location.dict(),
+                "date_range": {
+                    "start": start.dict(),
+                    "end": end.dict()
+                }
+            }
+        )
+        assert response.status_code == 422
+
+def test_unknown_timezone(client, test_datetime, test_location):
+    """An unknown timezone is rejected by validation on every route that takes a DateTime."""
+    bad = {**test_datetime.model_dump(), "timezone": "Mars/Olympus_Mons"}
+    for path in ("/api/v1/ephemeris/birth-chart", "/api/v1/ephemeris/houses", "/api/v1/ephemeris/aspects"):
+        response = client.post(path, json={"datetime": bad, "location": test_location.dict()})
+        assert response.status_code == 422
+    response = client.post(
+        "/api/v1/ephemeris/transits-by-natal-inputs",
+        json={
+            "datetime": test_datetime.dict(),
+            "location": test_location.dict(),
+            "date_range": {"start": bad, "end": bad}
+        }
+    )
+    assert response.status_code == 422
 
-def test_calculate_significant_events(test_datetime):
+def test_calculate_significant_events(client, test_datetime):
     """Test the significant events calculation endpoint."""
     response = client.post(
         "/api/v1/ephemeris/significant-events",
@@ -115,7 +251,7 @@ def test_calculate_significant_events(test_datetime):
     )
     assert response.status_code == 501  # Should be NotImplementedError
 
-def test_calculate_fixed_stars(test_datetime):
+def test_calculate_fixed_stars(client, test_datetime):
     """Test the fixed stars calculation endpoint."""
     response = client.post(
         "/api/v1/ephemeris/fixed-stars",
@@ -125,7 +261,7 @@ def test_calculate_fixed_stars(test_datetime):
     )
     assert response.status_code == 501  # Should be NotImplementedError
 
-def test_calculate_lunar_phases(test_datetime):
+def test_calculate_lunar_phases(client, test_datetime):
     """Test the lunar phases calculation endpoint."""
     response = client.post(
         "/api/v1/ephemeris/lunar-phases",
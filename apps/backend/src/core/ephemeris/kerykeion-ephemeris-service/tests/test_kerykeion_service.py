@@ -1,4 +1,9 @@
+import asyncio
+import multiprocessing
 import pytest
+import pytest_asyncio
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import pytz
 from app.services.kerykeion_service import KerykeionService
@@ -7,6 +12,7 @@ from app.models.astronomical import (
     GeoPosition,
     HouseSystem,
     BirthChart,
+    CelestialBody,
     DateRange
 )
 
@@ -58,7 +64,7 @@ def mumbai_birth_data():
         "house_system": HouseSystem.PLACIDUS
     }
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def mumbai_birth_chart(kerykeion_service, mumbai_birth_data):
     """Calculate Mumbai birth chart."""
     return await kerykeion_service.calculate_birth_chart(
@@ -80,6 +86,20 @@ def transit_date():
         timezone="Asia/Kolkata"
     )
 
+@pytest.fixture
+def transit_end_date(request):
+    """Transit range end at noon Kolkata time; parametrize indirectly with (year, month, day)."""
+    year, month, day = request.param
+    return DateTime(
+        year=year,
+        month=month,
+        day=day,
+        hour=12,
+        minute=0,
+        second=0,
+        timezone="Asia/Kolkata"
+    )
+
 @pytest.mark.asyncio
 async def test_calculate_birth_chart(kerykeion_service, mumbai_birth_data):
     """Test birth chart calculation."""
@@ -107,6 +127,161 @@ async def test_calculate_birth_chart(kerykeion_service, mumbai_birth_data):
     asc_house = birth_chart.houses[0]
     assert 256.0 <= asc_house.cusp <= 257.0  # Ascendant should be around 256.69° (Sagittarius)
 
+@pytest.mark.asyncio
+async def test_angles_match_houses(kerykeion_service, mumbai_birth_data):
+    """Angles and house cusps come from the same seconds-precision instant."""
+    birth_datetime = mumbai_birth_data["datetime"].model_copy(update={"second": 45})
+    birth_chart = await kerykeion_service.calculate_birth_chart(
+        birth_datetime,
+        mumbai_birth_data["location"],
+        mumbai_birth_data["house_system"]
+    )
+
+    assert birth_chart.angles.ascendant == birth_chart.houses[0].cusp
+    assert birth_chart.angles.midheaven == birth_chart.houses[9].cusp
+    assert birth_chart.angles.descendant == pytest.approx(birth_chart.houses[6].cusp)
+    assert birth_chart.angles.imum_coeli == pytest.approx(birth_chart.houses[3].cusp)
+
+@pytest.mark.asyncio
+async def test_calculate_birth_chart_in_new_thread(kerykeion_service, mumbai_birth_data):
+    """Swiss Ephemeris state is per thread; a fresh worker must still find the ephemeris files."""
+    args = (
+        mumbai_birth_data["datetime"],
+        mumbai_birth_data["location"],
+        mumbai_birth_data["house_system"]
+    )
+    await kerykeion_service.calculate_birth_chart(*args)
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        birth_chart = await asyncio.get_running_loop().run_in_executor(
+            pool, kerykeion_service._calculate_birth_chart_sync, *args
+        )
+    
+    assert any(body.id == CelestialBody.CHIRON for body in birth_chart.bodies)
+
+@pytest.mark.asyncio
+async def test_birth_chart_cache(kerykeion_service, sample_birth_data, sample_location):
+    """The same instant requested in different timezones is served from the chart cache."""
+    first = await kerykeion_service.calculate_birth_chart(sample_birth_data, sample_location)
+    
+    gmt_birth_data = DateTime(
+        year=2000,
+        month=1,
+        day=1,
+        hour=17,
+        minute=0,
+        second=0,
+        timezone='GMT'
+    )
+    second = await kerykeion_service.calculate_birth_chart(gmt_birth_data, sample_location)
+    
+    assert second is first
+
+@pytest.mark.asyncio
+async def test_chart_store(mumbai_birth_data, tmp_path):
+    """A chart stored on disk by one service is served to another without recalculation."""
+    args = (
+        mumbai_birth_data["datetime"],
+        mumbai_birth_data["location"],
+        mumbai_birth_data["house_system"]
+    )
+    path = str(tmp_path / "charts.db")
+    first = await KerykeionService(chart_store_path=path).calculate_birth_chart(*args)
+
+    reader = KerykeionService(chart_store_path=path)
+    def calculate(*_):
+        raise AssertionError("chart should come from the store")
+    reader._calculate_birth_chart_sync = calculate
+    stored = await reader.calculate_birth_chart(*args)
+
+    assert stored.model_dump(exclude_unset=True) == first.model_dump(exclude_unset=True)
+
+@pytest.mark.asyncio
+async def test_chart_store_errors(mumbai_birth_data, tmp_path):
+    """Unreadable rows and unopenable databases fall back to calculating the chart."""
+    args = (
+        mumbai_birth_data["datetime"],
+        mumbai_birth_data["location"],
+        mumbai_birth_data["house_system"]
+    )
+    path = tmp_path / "charts.db"
+    expected = await KerykeionService(chart_store_path=str(path)).calculate_birth_chart(*args)
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE charts SET chart = ?", (b'{"bodies": []}',))
+
+    corrupt = await KerykeionService(chart_store_path=str(path)).calculate_birth_chart(*args)
+    missing = await KerykeionService(
+        chart_store_path=str(tmp_path / "missing" / "charts.db")
+    ).calculate_birth_chart(*args)
+
+    assert corrupt.model_dump(exclude_unset=True) == expected.model_dump(exclude_unset=True)
+    assert missing.model_dump(exclude_unset=True) == expected.model_dump(exclude_unset=True)
+
+@pytest.mark.asyncio
+async def test_calculate_houses(kerykeion_service, mumbai_birth_data):
+    """The houses-only path matches the houses of a full birth chart."""
+    args = (
+        mumbai_birth_data["datetime"],
+        mumbai_birth_data["location"],
+        mumbai_birth_data["house_system"]
+    )
+    houses = await kerykeion_service.calculate_houses(*args)
+    birth_chart = await kerykeion_service.calculate_birth_chart(*args)
+
+    assert len(houses) == 12
+    assert [house.cusp for house in houses] == [house.cusp for house in birth_chart.houses]
+    assert await kerykeion_service.calculate_houses(*args) is houses
+
+@pytest.mark.asyncio
+async def test_expand_houses(kerykeion_service, mumbai_birth_data):
+    """Derived house fields are only filled in when requested."""
+    houses = await kerykeion_service.calculate_houses(
+        mumbai_birth_data["datetime"],
+        mumbai_birth_data["location"],
+        mumbai_birth_data["house_system"]
+    )
+    assert houses[0].next_cusp is None
+
+    expanded = kerykeion_service.expand_houses(houses, {"next_cusp", "size"})
+    assert [house.next_cusp for house in expanded] == [house.cusp for house in houses[1:] + houses[:1]]
+    assert sum(house.size for house in expanded) == pytest.approx(360.0)
+    assert houses[0].next_cusp is None  # Cached houses are left untouched
+
+@pytest.mark.asyncio
+async def test_calculate_aspects(kerykeion_service, mumbai_birth_data):
+    """The aspects-only path matches the aspects of a full birth chart."""
+    aspects = await kerykeion_service.calculate_aspects(
+        mumbai_birth_data["datetime"],
+        mumbai_birth_data["location"]
+    )
+    birth_chart = await kerykeion_service.calculate_birth_chart(
+        mumbai_birth_data["datetime"],
+        mumbai_birth_data["location"],
+        mumbai_birth_data["house_system"]
+    )
+
+    assert aspects
+    assert aspects == birth_chart.aspects
+
+@pytest.mark.asyncio
+async def test_aspects_applying(kerykeion_service, mumbai_birth_data):
+    """An aspect is applying exactly when its orb is smaller a little later."""
+    later = mumbai_birth_data["datetime"].model_copy(update={"minute": 54})
+    now_aspects = await kerykeion_service.calculate_aspects(
+        mumbai_birth_data["datetime"], mumbai_birth_data["location"]
+    )
+    later_aspects = await kerykeion_service.calculate_aspects(later, mumbai_birth_data["location"])
+    later_orbs = {(a.body1, a.type, a.body2): a.orb for a in later_aspects}
+
+    compared = 0
+    for aspect in now_aspects:
+        later_orb = later_orbs.get((aspect.body1, aspect.type, aspect.body2))
+        if later_orb is None or abs(later_orb - aspect.orb) < 1e-6:
+            continue
+        assert aspect.applying == (later_orb < aspect.orb)
+        compared += 1
+    assert compared
+
 @pytest.mark.asyncio
 async def test_calculate_transits(kerykeion_service, mumbai_birth_data, transit_date):
     """Test transit calculation."""
@@ -142,6 +317,63 @@ async def test_calculate_transits(kerykeion_service, mumbai_birth_data, transit_
         assert hasattr(aspect, 'applying')  # Should indicate if aspect is applying
         assert aspect.type in ["conjunction", "opposition", "trine", "square", "sextile"]  # Major aspects
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transit_end_date", [(2024, 5, 2)], indirect=True)
+async def test_calculate_transits_over_range(kerykeion_service, mumbai_birth_chart, transit_date, transit_end_date):
+    """A date range reports each aspect of its first day, at the tightest orb reached."""
+    first_day = await kerykeion_service.calculate_transits(
+        mumbai_birth_chart, DateRange(start=transit_date, end=transit_date), orb=1.0
+    )
+    month = await kerykeion_service.calculate_transits(
+        mumbai_birth_chart, DateRange(start=transit_date, end=transit_end_date), orb=1.0
+    )
+
+    month_orbs = {(a.body1, a.type, a.body2): a.orb for a in month}
+    assert len(month_orbs) == len(month)  # Each aspect reported once
+    assert len(month) > len(first_day)
+    for aspect in first_day:
+        assert month_orbs[(aspect.body1, aspect.type, aspect.body2)] <= aspect.orb
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transit_end_date", [(2024, 5, 2)], indirect=True)
+async def test_calculate_transits_finds_moon_aspects(kerykeion_service, mumbai_birth_chart, transit_date, transit_end_date):
+    """The Moon perfects aspects to the natal Sun mid-month; the sweep must not step past them.
+
+    Orb is the tightest reached; exact and applying describe the start of the
+    range, when the Moon is ~99° past the natal Sun and moving away from it.
+    """
+    transits = await kerykeion_service.calculate_transits(
+        mumbai_birth_chart, DateRange(start=transit_date, end=transit_end_date), orb=1.0
+    )
+
+    moon_to_sun = {
+        a.type: a for a in transits
+        if (a.body1, a.body2) == (CelestialBody.MOON, CelestialBody.SUN)
+    }
+    conjunction = moon_to_sun["conjunction"]
+    trine = moon_to_sun["trine"]
+    assert conjunction.orb < 0.01 and trine.orb < 0.01
+    assert not conjunction.exact and not trine.exact
+    assert not conjunction.applying  # Separating from the conjunction at the start
+    assert trine.applying  # Closing on the trine at the start
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transit_end_date", [(2026, 4, 2)], indirect=True)
+async def test_calculate_transits_long_range(kerykeion_service, mumbai_birth_chart, transit_date, transit_end_date):
+    """Multi-year sweeps run in a worker process and still respect the orb limit."""
+    date_range = DateRange(start=transit_date, end=transit_end_date)
+
+    in_thread = await kerykeion_service.calculate_transits(mumbai_birth_chart, date_range, orb=1.0)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        kerykeion_service.transit_pool = pool
+        transits = await kerykeion_service.calculate_transits(mumbai_birth_chart, date_range, orb=1.0)
+
+    assert transits
+    assert transits == in_thread
+    assert all(aspect.orb <= 1.0 for aspect in transits)
+    # Each aspect reported once
+    assert len({(a.body1, a.type, a.body2) for a in transits}) == len(transits)
+
 @pytest.mark.asyncio
 async def test_mumbai_birth_chart(kerykeion_service):
     """Test birth chart calculation for Mumbai, September 29, 1991, 11:44 AM IST."""